@@ -2,11 +2,24 @@
 __version__ = "0.0.4"
 __author__ = "Ben Fisher"
 
+import functools
 import math
+import types
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; without it the kernels below run as plain Python
+    HAS_NUMBA = False
+    prange = range
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 import rcmaterials as mat
 
 CMAX = math.inf  # Pure compression condition: c = infinity
@@ -14,8 +27,17 @@ CCOMP = math.inf  # Pure compression condition: c = infinity
 CMIN = 0  # Pure tension condition: c = 0
 CTENS = 0  # Pure tension condition: c = 0
 
+@functools.lru_cache(maxsize=32)
+def _equal_layer_distances(layer_count, bar_diameter, clear_cover, total_member_depth):
+    first_layer = clear_cover + bar_diameter/2
+    spacing = (total_member_depth - 2 * clear_cover - bar_diameter) / max(layer_count - 1, 1)
+    layer_distances = first_layer + spacing * np.arange(layer_count)
+    layer_distances.flags.writeable = False
+    return layer_distances
+
 def equal_layer_distances(layer_count, bar_diameter, clear_cover, total_member_depth):
-    return np.linspace(clear_cover + bar_diameter/2, total_member_depth - clear_cover - bar_diameter/2, layer_count)
+    """Return equally spaced layer distances; cached per section, so build these once and reuse them for every c value"""
+    return _equal_layer_distances(layer_count, bar_diameter, clear_cover, total_member_depth).copy()
 
 def reverse_layers(total_member_depth, layer_distances):
     layers = layer_distances.copy()
@@ -37,16 +59,18 @@ def get_layer_areas(layer_bar_sizes, layer_bar_counts, rebar: mat.RebarMaterial)
     return layer_areas
 
 def get_total_steel_area(layer_areas):
-    return sum(layer_areas)
+    return np.sum(layer_areas)
 
 def column_reinforcement_ratio(concrete_gross_area, layer_areas):
     return sum(layer_areas) / concrete_gross_area
 
 def max_axial(gross_area, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial, isTensionCase: bool = False):
+    # layer_areas may be the array of layer areas, or their precomputed total from get_total_steel_area()
+    total_steel_area = layer_areas if np.ndim(layer_areas) == 0 else np.sum(layer_areas)
     if isTensionCase == False:
-        return (0.85 * concrete.fc) * (gross_area - np.sum(layer_areas)) + rebar.fy * np.sum(layer_areas)  # Po per Eq. (22.4.2.2)
+        return concrete.fc_085 * (gross_area - total_steel_area) + rebar.fy * total_steel_area  # Po per Eq. (22.4.2.2)
     else:
-        return np.sum(layer_areas) * rebar.fy * -1
+        return total_steel_area * rebar.fy * -1
 
 def Po(gross_area, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
     return max_axial(gross_area, layer_areas, concrete, rebar, False)
@@ -58,16 +82,13 @@ def capped_compression(max_compression, has_spirals: bool = False, is_ch_10_comp
     # max axial per ACI 318 Table 22.4.2.1
     # This function is a simplified version of Pnmax
     coeff = 0.80
-    if has_spirals == True | is_ch_10_composite == True:
+    if has_spirals or is_ch_10_composite:
        coeff = 0.85
     return max_compression * coeff
 
 def Pnmax(gross_area, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial, has_spirals: bool = False, is_ch_10_composite: bool = False):
     # Maximum compression strength, Pnmax, per ACI 318 Table 22.4.2.1
-    coeff = 0.80
-    if has_spirals == True | is_ch_10_composite == True:
-       coeff = 0.85
-    return coeff * max_axial(gross_area, layer_areas, concrete, rebar, isTensionCase = False)
+    return capped_compression(max_axial(gross_area, layer_areas, concrete, rebar, isTensionCase = False), has_spirals, is_ch_10_composite)
     
     
 #================================================================================
@@ -96,11 +117,14 @@ def z_from_c(c, layer_distance, concrete: mat.ConcreteMaterial, rebar: mat.Rebar
     else:
         return (c - layer_distance) / c * (concrete.ecu / rebar.ey)
 
-def c_from_z(z, layer_distance, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    if z * rebar.ey == concrete.ecu:
+def _c_from_z(z, layer_distance, ey, ecu):
+    if z * ey == ecu:
         return CCOMP
     else:
-        return max(layer_distance / (1 - (z * rebar.ey / concrete.ecu)), 0)
+        return max(layer_distance / (1 - (z * ey / ecu)), 0)
+
+def c_from_z(z, layer_distance, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    return _c_from_z(z, layer_distance, rebar.ey, concrete.ecu)
 
 def c_from_strain(layer_strain, layer_distance, concrete: mat.ConcreteMaterial):
     if layer_strain == concrete.ecu:
@@ -111,8 +135,10 @@ def c_from_strain(layer_strain, layer_distance, concrete: mat.ConcreteMaterial):
 def cs_from_zs(zs, layer_distance, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
     count = zs.shape[0]
     cs = np.zeros(count)
+    ey = rebar.ey
+    ecu = concrete.ecu
     for i in range(count):
-        cs[i] = c_from_z(zs[i], layer_distance, concrete, rebar)
+        cs[i] = _c_from_z(zs[i], layer_distance, ey, ecu)
     return cs
 
 def z_from_strain(strain, rebar: mat.RebarMaterial):
@@ -120,13 +146,13 @@ def z_from_strain(strain, rebar: mat.RebarMaterial):
 
 def zs_from_strains(strains, rebar: mat.RebarMaterial):
     """Batch create array of zs from array of strains"""
-    count = strains.shape[0]
-    zs = np.zeros(count)
-    for i in range(count):
-        zs[i] = strains[i] / rebar.ey
-    return zs
+    return np.asarray(strains, dtype=float) / rebar.ey
 
 def strain_from_c(c, layer_distance,  concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    if np.ndim(c) != 0:
+        c = np.asarray(c, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(c == 0, rebar.ult_strain, concrete.ecu * (1 - layer_distance / c))
     if c == 0:
         return rebar.ult_strain
     else:
@@ -152,57 +178,180 @@ def layer_strain(layer_distance, c, concrete: mat.ConcreteMaterial, rebar: mat.R
 
 def layer_stress(layer_distance, c, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
     strain = layer_strain(layer_distance, c, concrete, rebar)
-    if abs(strain) >= rebar.ey:
-        return rebar.fy * np.sign(strain)
-    else:
-        return strain * rebar.Es
+    return max(-rebar.fy, min(rebar.fy, strain * rebar.Es))  # Elastic-perfectly plastic, limited to +/- fy
     
 def layer_force(layer_area, layer_distance, c, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
     if layer_distance >= c:
         return layer_stress(layer_distance, c, concrete, rebar) * layer_area
     else:
-        return (layer_stress(layer_distance, c, concrete, rebar) - 0.85 * concrete.fc) * layer_area
+        return (layer_stress(layer_distance, c, concrete, rebar) - concrete.fc_085) * layer_area
     
-def sum_layer_forces(layer_areas, layer_distances, c, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    # This function only considers the steel contributions.
-    force = 0
+def layer_strains(layer_distances, cs, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    """Return an array of layer strains with shape [len(cs), len(layer_distances)] for a sweep of c values"""
+    cs = np.atleast_1d(np.asarray(cs, dtype=float))[:, None]
+    layer_distances = np.asarray(layer_distances, dtype=float)[None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        strains = (cs - layer_distances) * concrete.ecu / cs
+    strains = np.where(cs == 0, rebar.ult_strain, strains)
+    return np.where(cs == math.inf, concrete.ecu, strains)
+
+def layer_stresses(layer_distances, cs, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    """Return an array of layer stresses with shape [len(cs), len(layer_distances)], limited to +/- fy"""
+    stresses = layer_strains(layer_distances, cs, concrete, rebar)  # A new array, so it is reused in place as the buffer
+    stresses *= rebar.Es
+    return np.clip(stresses, -rebar.fy, rebar.fy, out=stresses)
+
+def layer_forces(layer_areas, layer_distances, cs, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    """Return an array of layer forces with shape [len(cs), len(layer_distances)]; layers above c deduct the displaced concrete"""
+    cs = np.atleast_1d(np.asarray(cs, dtype=float))[:, None]
+    layer_distances = np.asarray(layer_distances, dtype=float)
+    stresses = layer_stresses(layer_distances, cs[:, 0], concrete, rebar)
+    stresses[layer_distances[None, :] < cs] -= concrete.fc_085
+    stresses *= np.asarray(layer_areas, dtype=float)[None, :]
+    return stresses
+
+# Kernels are given explicit signatures so they compile when declared and load from the on-disk cache
+# on later imports. fastmath omits the 'nnan'/'ninf' flags, since c = inf (pure compression) must compare correctly.
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'reassoc'}
+
+@njit(['UniTuple(float64, 2)(float64[::1], float64[::1], float64, float64, float64, float64, float64, float64, float64)',
+       'UniTuple(float32, 2)(float32[::1], float32[::1], float32, float32, float32, float32, float32, float32, float32)'],
+      cache=True, fastmath=FASTMATH_FLAGS)
+def _layer_force_and_moment_sums(layer_areas, layer_distances, c, h, fc_085, fy, Es, ecu, ult_strain):
+    """Sum the steel layer forces and their moments about h/2 for a single c value in one pass"""
+    # Constants take the input dtype so the float32 version does not promote to float64.
+    zero = layer_areas.dtype.type(0)
+    half = layer_areas.dtype.type(0.5)
+    force = zero
+    moment = zero
+    # The c = 0 (pure tension) check is made once, outside the loop. For c = inf, ecu / c is 0, so every layer is at ecu.
+    base_strain = ult_strain if c == zero else ecu
+    strain_slope = zero if c == zero else ecu / c
     for i in range(layer_distances.shape[0]):
-        force += layer_force(layer_areas[i], layer_distances[i], c, concrete, rebar)
-    return force
+        strain = base_strain - layer_distances[i] * strain_slope
+        stress = max(-fy, min(fy, strain * Es))
+        if layer_distances[i] < c:
+            stress -= fc_085
+        layer_force = stress * layer_areas[i]
+        force += layer_force
+        moment += layer_force * (h * half - layer_distances[i])
+    return force, moment
+
+# Sweeps with fewer layer evaluations (c values x layers) than this run serially. A P-M diagram from get_half_pm_points
+# is ~30 c values x a few layers, i.e. ~1 us of work, where starting the thread pool costs more than the sweep itself.
+PARALLEL_SWEEP_MIN_WORK = 50000
+
+PM_SWEEP_SIGNATURES = [
+    'void(float64[::1], float64[::1], float64[::1], float64, float64, float64, float64, float64, float64, float64, float64, float64[:, ::1])',
+    'void(float32[::1], float32[::1], float32[::1], float32, float32, float32, float32, float32, float32, float32, float32, float32[:, ::1])']
+
+def _pm_sweep_body(cs, layer_areas, layer_distances, h, bw, fc_085, beta1, fy, Es, ecu, ult_strain, out):
+    """Write one [P, M] row per c value into out, including the concrete stress block"""
+    half = cs.dtype.type(0.5)
+    for k in prange(cs.shape[0]):  # prange runs as a plain range unless compiled with parallel=True
+        force, moment = _layer_force_and_moment_sums(layer_areas, layer_distances, cs[k], h, fc_085, fy, Es, ecu, ult_strain)
+        a = min(cs[k] * beta1, h)
+        concrete_force = fc_085 * bw * a
+        out[k, 0] = force + concrete_force
+        out[k, 1] = moment + concrete_force * (h - a) * half
+
+def _compile_pm_sweep(name, parallel):
+    """Compile _pm_sweep_body as its own function called name. numba names its on-disk cache after the function and
+    does not key it on parallel=, so compiling _pm_sweep_body itself twice would let one variant load the other's code."""
+    body = types.FunctionType(_pm_sweep_body.__code__, _pm_sweep_body.__globals__, name)
+    body.__qualname__ = name
+    body.__doc__ = _pm_sweep_body.__doc__
+    return njit(PM_SWEEP_SIGNATURES, cache=True, fastmath=FASTMATH_FLAGS, parallel=parallel)(body)
+
+_pm_sweep = _compile_pm_sweep('_pm_sweep', parallel=False)
+_pm_sweep_parallel = _compile_pm_sweep('_pm_sweep_parallel', parallel=True)
+
+# ConcreteMaterial/RebarMaterial stay plain Python classes rather than numba jitclasses: RebarMaterial subclasses
+# SteelMaterial, both hold dict tables and property setters, jitclasses cannot be cached to disk, and numba would become
+# a hard dependency of rcmaterials. The kernels instead take the scalars below, read from the materials once per call.
+def _unpack(concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial, dtype=float):
+    """Return the material properties used by the kernels as dtype scalars: (fc_085, beta1, ecu, fy, Es, ult_strain)"""
+    return (dtype(concrete.fc_085), dtype(concrete.beta1), dtype(concrete.ecu),
+            dtype(rebar.fy), dtype(rebar.Es), dtype(rebar.ult_strain))
+
+def _as_float_array(values, dtype=np.float64):
+    """Return values as a contiguous, writeable array of dtype (float64 or float32), as expected by the kernels"""
+    values = np.ascontiguousarray(values, dtype=dtype)
+    # numba types read-only arrays separately, so they would not match the kernels' explicit signatures.
+    return values if values.flags.writeable else values.copy()
+
+def _check_layer_shapes(layer_areas, layer_distances):
+    """Raise ValueError unless there is one area per layer distance; the kernels do not bounds-check their reads"""
+    if layer_areas.shape != layer_distances.shape:
+        raise ValueError(f"layer_areas has shape {layer_areas.shape} but layer_distances has shape {layer_distances.shape}; they must match")
+
+def _steel_sums(layer_areas, layer_distances, c, h, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    fc_085, beta1, ecu, fy, Es, ult_strain = _unpack(concrete, rebar)
+    layer_areas, layer_distances = _as_float_array(layer_areas), _as_float_array(layer_distances)
+    _check_layer_shapes(layer_areas, layer_distances)
+    return _layer_force_and_moment_sums(layer_areas, layer_distances, float(c), float(h), fc_085, fy, Es, ecu, ult_strain)
+
+def sum_layer_forces_and_moments(layer_areas, layer_distances, c, h, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    """Return the steel force and moment sums from a single pass over the layer forces; c may be a single value or an array"""
+    if np.ndim(c) == 0:
+        return _steel_sums(layer_areas, layer_distances, c, h, concrete, rebar)
+    forces = layer_forces(layer_areas, layer_distances, c, concrete, rebar)
+    arms = h/2 - np.asarray(layer_distances, dtype=float)
+    return forces.sum(axis=1), forces @ arms
+
+def sum_layer_forces(layer_areas, layer_distances, c, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    # This function only considers the steel contributions. c may be a single value or an array of values.
+    return sum_layer_forces_and_moments(layer_areas, layer_distances, c, 0, concrete, rebar)[0]
 
 def sum_layer_moments(layer_areas, layer_distances, c, h, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    # This function only considers the steel contributions.
-    moment = 0
-    for i in range(layer_distances.shape[0]):
-        moment += layer_force(layer_areas[i], layer_distances[i], c, concrete, rebar) * (h/2 - layer_distances[i])
-    return moment
+    # This function only considers the steel contributions. c may be a single value or an array of values.
+    return sum_layer_forces_and_moments(layer_areas, layer_distances, c, h, concrete, rebar)[1]
+
+def sum_total_forces_and_moments(c, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
+    steel_force, steel_moment = sum_layer_forces_and_moments(layer_areas, layer_distances, c, h, concrete, rebar)
+    a = min(c * concrete.beta1, h) if np.ndim(c) == 0 else np.minimum(c * concrete.beta1, h)
+    concrete_force = concrete.fc_085 * bw * a
+    concrete_moment = concrete_force * (h - a) / 2
+    return steel_force + concrete_force, steel_moment + concrete_moment
 
 def sum_total_forces(c, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    steel_force = sum_layer_forces(layer_areas, layer_distances, c, concrete, rebar)
-    concrete_force = 0.85 * bw * (min(c * concrete.beta1, h)) * concrete.fc
-    return steel_force + concrete_force
+    return sum_total_forces_and_moments(c, bw, h, layer_distances, layer_areas, concrete, rebar)[0]
 
 def sum_total_moments(c, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    steel_moment = sum_layer_moments(layer_areas, layer_distances, c, h, concrete, rebar)
-    concrete_force = 0.85 * bw * min(c * concrete.beta1, h) * concrete.fc
-    concrete_moment = concrete_force * (h - (min(c * concrete.beta1, h))) / 2
-    return steel_moment + concrete_moment       
+    return sum_total_forces_and_moments(c, bw, h, layer_distances, layer_areas, concrete, rebar)[1]
     
-def pm_points(c, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    P = sum_total_forces(c, bw, h, layer_distances, layer_areas, concrete, rebar)
-    M = sum_total_moments(c, bw, h, layer_distances, layer_areas, concrete, rebar)
+def pm_sweep(cs, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial, out=None, dtype=np.float64):
+    """Return a [len(cs), 2] array of [P, M] rows for an array of c values.
+    Pass a previous result as out to refill the same buffer instead of allocating a new one, e.g. when redrawing a diagram."""
+    cs = _as_float_array(np.atleast_1d(cs), dtype)
+    if out is None:
+        out = np.empty((cs.shape[0], 2), dtype=dtype)
+    elif out.shape != (cs.shape[0], 2) or out.dtype != dtype or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous {np.dtype(dtype).name} array of shape ({cs.shape[0]}, 2)")
+    layer_areas, layer_distances = _as_float_array(layer_areas, dtype), _as_float_array(layer_distances, dtype)
+    _check_layer_shapes(layer_areas, layer_distances)
+    if HAS_NUMBA:
+        fc_085, beta1, ecu, fy, Es, ult_strain = _unpack(concrete, rebar, dtype)
+        sweep = _pm_sweep_parallel if cs.shape[0] * layer_areas.shape[0] >= PARALLEL_SWEEP_MIN_WORK else _pm_sweep
+        sweep(cs, layer_areas, layer_distances, dtype(h), dtype(bw), fc_085, beta1, fy, Es, ecu, ult_strain, out)
+    else:
+        out[:, 0], out[:, 1] = sum_total_forces_and_moments(cs, bw, h, layer_distances, layer_areas, concrete, rebar)
+    return out
+
+def pm_points(c, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial, dtype=np.float64):
+    """Return P, M and the strain at d for a single c value, or arrays of each for an array of c values.
+    For arrays, dtype=np.float32 halves the memory traffic of the sweep, which is ample precision for plotting."""
+    if np.ndim(c) == 0:
+        P, M = sum_total_forces_and_moments(c, bw, h, layer_distances, layer_areas, concrete, rebar)
+    else:
+        sweep = pm_sweep(c, bw, h, layer_distances, layer_areas, concrete, rebar, dtype=dtype)
+        P, M = sweep[:, 0], sweep[:, 1]
     d = max(layer_distances)
     strain_at_d = strain_from_c(c, d, concrete, rebar)
     return P, M, strain_at_d
 
-def pm_from_cs(cs, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
-    count = cs.shape[0]
-    P = np.zeros(count)
-    M = np.zeros(count)
-    strains = np.zeros(count)
-    for i in range(count):
-        P[i], M[i], strains[i] = pm_points(cs[i], bw, h, layer_distances, layer_areas, concrete, rebar)
-    return P, M, strains
+def pm_from_cs(cs, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial, dtype=np.float64):
+    return pm_points(np.asarray(cs, dtype=float), bw, h, layer_distances, layer_areas, concrete, rebar, dtype)
 
 #================================================================================
 #    
@@ -210,6 +359,10 @@ def pm_from_cs(cs, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMa
 #    
 #================================================================================   
 
+def _sign(value):
+    """Scalar sign (-1, 0 or 1); avoids the NumPy call overhead of np.sign on a single float"""
+    return int(value > 0) - int(value < 0)
+
 def get_z_at_p(p_goal, bw, h, layer_distances, layer_areas, concrete: mat.ConcreteMaterial, rebar: mat.RebarMaterial):
     
     min_tolerance = 1e-12
@@ -221,20 +374,29 @@ def get_z_at_p(p_goal, bw, h, layer_distances, layer_areas, concrete: mat.Concre
     z_max = comp_z(concrete, rebar)
     d = max(layer_distances)
     tolerance = (z_max - z_min) / 2
+
+    # Bind the material properties and layer arrays to locals once, so each iteration only does arithmetic and a kernel call.
+    fc_085, beta1, ecu, fy, Es, ult_strain = _unpack(concrete, rebar)
+    ey = rebar.ey
+    areas = _as_float_array(layer_areas)
+    distances = _as_float_array(layer_distances)
+    _check_layer_shapes(areas, distances)
+    bw, h = float(bw), float(h)
+
+    def net_force(z):
+        c = float(_c_from_z(z, d, ey, ecu))
+        steel_force = _layer_force_and_moment_sums(areas, distances, c, h, fc_085, fy, Es, ecu, ult_strain)[0]
+        return steel_force + fc_085 * bw * min(c * beta1, h) - p_goal
     
     while keep_running == True:
-        c_min = c_from_z(z_min, d, concrete, rebar)
-        c_max = c_from_z(z_max, d, concrete, rebar)
-        p_min = sum_total_forces(c_min, bw, h, layer_distances, layer_areas, concrete, rebar) - p_goal
-        p_max = sum_total_forces(c_max, bw, h, layer_distances, layer_areas, concrete, rebar) - p_goal
+        p_min = net_force(z_min)
         
         z = (z_min + z_max) / 2
-        c = c_from_z(z, d, concrete, rebar)
-        p = sum_total_forces(c, bw, h, layer_distances, layer_areas, concrete, rebar) - p_goal
+        p = net_force(z)
         
-        if np.sign(p) == 0:
+        if p == 0:
             return z
-        elif np.sign(p) == np.sign(p_min):
+        elif _sign(p) == _sign(p_min):
             z_min = z
         else:
             z_max = z
@@ -253,9 +415,10 @@ def get_positive_zs(bw, h, layer_distances, layer_areas, concrete: mat.ConcreteM
                        has_spirals: bool = False, 
                        is_ch_10_composite: bool = False):
         
-    po = Po(bw * h, layer_areas, concrete, rebar)
+    total_steel_area = get_total_steel_area(layer_areas)
+    po = Po(bw * h, total_steel_area, concrete, rebar)
 
-    p_capped = Pnmax(bw * h, layer_areas, concrete, rebar, has_spirals, is_ch_10_composite)
+    p_capped = Pnmax(bw * h, total_steel_area, concrete, rebar, has_spirals, is_ch_10_composite)
     # z_at_p_capped = get_z_at_p(p_capped, bw, h, layer_distances, layer_areas, concrete, rebar)
 
     c_at_z_0 = c_from_z(0, max(layer_distances), concrete, rebar)
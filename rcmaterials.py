@@ -5,9 +5,10 @@ __author__ = "Ben Fisher"
 
 import numpy as np
 import math
+import functools
+import types
 
-#TODO: Global bar_* variables have been copied to RebarMaterial(), determine if they still need to be global here?
-# Rebar sizes, diameters, areas, weights per ACI 318 Appendix A
+# Rebar sizes, diameters, areas, weights per ACI 318 Appendix A. RebarMaterial() refers to these tables rather than copying them.
 ACI_BAR_NUMBERS = [3, 4, 5, 6, 7, 8, 9, 10, 11, 14, 18]
 
 ACI_BAR_DIAMETERS = {
@@ -56,24 +57,41 @@ ACI_BAR_STANDARDS = {'carbon': 'ASTM A615',
               'low alloy': 'ASTM 706',
               'stainless': 'ASTM A995'}
 
+# Material functions
+@functools.lru_cache(maxsize=16)
+def get_beta1(fc):
+    """Calculate the beta1 factor per ACI 318 Eq. (22.2.2.4.1) and Table 22.2.2.4.3. Cached, as only a few fc values are used in practice."""
+    if fc <= 4000:
+        return 0.85  # ACI 318 Table 22.2.2.4.3 case (a)
+    elif fc >= 8000:
+        return 0.65  # ACI 318 Table 22.2.2.4.3 case (c)
+    else:
+        return 0.85 - 0.05 * (fc - 4000) / 1000  # ACI 318 Table 22.2.2.4.3 case (b)
+
 # Material classes
 class ConcreteMaterial:
     def __init__(self, fc, lam=1.0):
-        self.fc = fc  # Minimum specified 28-day compressive strength (psi), user-specified.
         self.lam = lam  # Lambda factor for light-weight concrete (LWC) per ACI 318 Table 19.2.4.2.
         self.ecu = 0.003  # Maximum concrete compression strain per ACI 318 Sec. 22.2.2.1.
-        self.Ec = 57000 * sqrt(self.fc)  # Elastic modulus (psi) per ACI 318 Eq. (19.2.2.1.b).
-        self.fr = 7.5 * lam * sqrt(fc)  # Modulus of rupture (psi) per ACI 318 Eq. (19.2.3.1).
-    
+        self.fc = fc  # Minimum specified 28-day compressive strength (psi), user-specified.
+
+    @property
+    def fc(self):
+        return self._fc
+
+    @fc.setter
+    def fc(self, new_fc):
+        """Set fc and cache the values derived from it, so they are not recalculated on every use."""
+        self._fc = new_fc
+        self.sqrt_fc = math.sqrt(new_fc)
+        self.fc_085 = 0.85 * new_fc  # Equivalent rectangular stress block intensity per ACI 318 Sec. 22.2.2.4.1.
+        self.Ec = 57000 * self.sqrt_fc  # Elastic modulus (psi) per ACI 318 Eq. (19.2.2.1.b).
+        self.fr = 7.5 * self.lam * self.sqrt_fc  # Modulus of rupture (psi) per ACI 318 Eq. (19.2.3.1).
+        self._beta1 = get_beta1(new_fc)
+
     @property
     def beta1(self):
-        """Calculate the beta1 factor per ACI 318 Eq. (22.2.2.4.1) and Table 22.2.2.4.3"""
-        if self.fc <= 4000:
-            return 0.85  # ACI 318 Table 22.2.2.4.3 case (a)
-        elif self.fc >= 8000:
-            return 0.65  # ACI 318 Table 22.2.2.4.3 case (c)
-        else:
-            return 0.85 - 0.05 * (self.fc - 4000) / 1000  # ACI 318 Table 22.2.2.4.3 case (b)
+        return self._beta1
 
 class SteelMaterial:
     def __init__(self, fy=60000, standard='ASTM A615', grade='60'):
@@ -92,38 +110,31 @@ class SteelMaterial:
 class RebarMaterial(SteelMaterial):
     def __init__(self, fy=60000):
         super().__init__(fy)
-        self.bar_numbers = [3, 4, 5, 6, 7, 8, 9, 10, 11, 14, 18]
-        self.bar_diameters = {
-                            3: 0.375,
-                            4: 0.500,
-                            5: 0.625,
-                            6: 0.750,
-                            7: 0.875,
-                            8: 1.000,
-                            9: 1.128,
-                            10: 1.270,
-                            11: 1.410,
-                            14: 1.693,
-                            18: 2.257
-                            }   
-        self._ult_strain = self.ult_strain  # Rebar ultimate strain, defaults to ASTM A615 values.
+        # Read-only views of the shared ACI tables, so an instance cannot alter them for every other RebarMaterial.
+        self.bar_numbers = tuple(ACI_BAR_NUMBERS)
+        self.bar_diameters = types.MappingProxyType(ACI_BAR_DIAMETERS)
+        self.bar_areas = types.MappingProxyType(ACI_BAR_AREAS)
+        self.bar_weights = types.MappingProxyType(ACI_BAR_WEIGHTS)
+        self._ult_strain = None  # Rebar ultimate strain, defaults to ASTM A615 values.
     
     @property
     def ult_strain(self):
-        return self._ult_strain
-    
-    @ult_strain.setter
-    def ult_strain(self):
-        """Ultimate strains associated with ASTM A615 material."""
+        """Ultimate strains associated with ASTM A615 material, unless overridden."""
+        if self._ult_strain is not None:
+            return self._ult_strain
         if self.fy <= 40000:
-            self._ult_strain = -0.155
+            return -0.155
         elif self.fy <= 60000:
-            self._ult_strain = -0.12
+            return -0.12
         elif self.fy <= 75000:
-            self._ult_strain = -0.07
+            return -0.07
         else:
-            self._ult_strain = -0.05  # For more information refer to ASCE 41-17, Sec. 10.3.3.1. 
-                         # For historic rebar lower values may be more appropriate (e.g. 0.02, etc.)
+            return -0.05  # For more information refer to ASCE 41-17, Sec. 10.3.3.1. 
+                          # For historic rebar lower values may be more appropriate (e.g. 0.02, etc.)
+    
+    @ult_strain.setter
+    def ult_strain(self, value):
+        self._ult_strain = value
     
     @property
     def bar_weight(self, bar_number, units = 'imperial'):